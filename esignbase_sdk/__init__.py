@@ -1,13 +1,35 @@
-from base64 import b64encode
-from collections.abc import Generator
+import asyncio
+import math
+import time
+from binascii import b2a_base64
+from collections.abc import AsyncGenerator, Generator, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime
 from enum import StrEnum
-from typing import Any, Final, Optional, cast
+from typing import Any, Final, Optional
+from urllib.parse import urlencode
 
-import requests
+import httpx
+import orjson
 
 BASE_URL: Final[str] = "https://app.esignbase.com/"
+DOWNLOAD_CHUNK_SIZE: Final[int] = 65536
+# maximum number of requests in flight for the bulk functions
+BULK_BATCH_SIZE: Final[int] = 32
+# error messages include at most this many bytes of the response body
+ERROR_BODY_LIMIT: Final[int] = 512
+# refresh tokens this many seconds before the server side expiry
+TOKEN_EXPIRY_MARGIN: Final[int] = 30
+
+# endpoint URLs are built once at import time instead of on every request
+_TOKEN_URL: Final[str] = f"{BASE_URL}oauth2/token"
+_TEMPLATES_URL: Final[str] = f"{BASE_URL}api/templates"
+_TEMPLATE_URL_PREFIX: Final[str] = f"{BASE_URL}api/template/"
+_DOCUMENTS_URL: Final[str] = f"{BASE_URL}api/documents"
+_DOCUMENT_URL: Final[str] = f"{BASE_URL}api/document"
+_DOCUMENT_URL_PREFIX: Final[str] = f"{_DOCUMENT_URL}/"
+_CREDITS_URL: Final[str] = f"{BASE_URL}api/credits"
 
 
 class GrantType(StrEnum):
@@ -32,6 +54,26 @@ class OAuth2Client:
     password: Optional[str] = None
     access_token: Optional[str] = None
     scope: list[Scope] = field(default_factory=list[Scope])
+    _session: Optional[httpx.Client] = field(default=None, init=False, repr=False, compare=False)
+    _auth_header: dict[str, str] = field(
+        default_factory=dict[str, str], init=False, repr=False, compare=False
+    )
+    _auth_token: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _basic_auth_header: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _token_body: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _token_key: Optional[tuple[Any, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _validated: bool = field(default=False, init=False, repr=False, compare=False)
+    _token_expires_at: float = field(default=math.inf, init=False, repr=False, compare=False)
+    _http: Optional[httpx.AsyncClient] = field(default=None, init=False, repr=False, compare=False)
+    _refresh_lock: Optional[asyncio.Lock] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # accept plain strings too, the enum member can then be compared by identity
+        self.grant_type = GrantType(self.grant_type)
 
     @property
     def is_connected(self) -> bool:
@@ -50,25 +92,48 @@ class Recipient:
 
 class ESignBaseSDKError(Exception):
     status_code: Optional[int] = None
+    response: Optional[httpx.Response] = None
 
-    def __init__(self, message: str, status_code: Optional[int] = None):
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        response: Optional[httpx.Response] = None,
+    ):
         super().__init__(message)
         self.status_code = status_code
+        self.response = response
+
+    @classmethod
+    def from_response(cls, message: str, response: httpx.Response) -> "ESignBaseSDKError":
+        """Error for a failed API response, the body is only decoded when the error is printed."""
+        return cls(message, status_code=response.status_code, response=response)
+
+    def __str__(self) -> str:
+        message = super().__str__()
+        if self.response is None:
+            return message
+        body = self.response.content[:ERROR_BODY_LIMIT].decode("utf-8", "replace")
+        return f"{message}: {body}"
+
+
+_GRANT_TYPE_CREDENTIALS: Final[dict[GrantType, tuple[str, ...]]] = {
+    GrantType.AUTHORIZATION_CODE: ("user_name", "password"),
+}
 
 
 def _validate(client: "OAuth2Client"):
-    if not client.scope:
-        raise ESignBaseSDKError("At least one scope must be provided")
-    if not client.id:
-        raise ESignBaseSDKError("Client ID is required")
-    if not client.secret:
+    if not (client.scope and client.id and client.secret):
+        if not client.scope:
+            raise ESignBaseSDKError("At least one scope must be provided")
+        if not client.id:
+            raise ESignBaseSDKError("Client ID is required")
         raise ESignBaseSDKError("Client secret is required")
-    if client.grant_type == GrantType.AUTHORIZATION_CODE and (
-        not client.user_name or not client.password
-    ):
-        raise ESignBaseSDKError(
-            "Username and password are required for authorization code grant type"
-        )
+    for attr in _GRANT_TYPE_CREDENTIALS.get(client.grant_type, ()):
+        if not getattr(client, attr):
+            raise ESignBaseSDKError(
+                "Username and password are required for authorization code grant type"
+            )
 
 
 def _ensure_connected(client: OAuth2Client):
@@ -76,172 +141,451 @@ def _ensure_connected(client: OAuth2Client):
         raise ESignBaseSDKError("OAuth2Client is not connected. Call connect() first.")
 
 
-def _api_request(client: OAuth2Client, method: str, path: str, retry: bool = True, **kwargs):
+@contextmanager
+def _transport_errors() -> Iterator[None]:
+    # network failures surface as ESignBaseSDKError, like API errors
+    try:
+        yield
+    except httpx.HTTPError as e:
+        raise ESignBaseSDKError(f"Request to ESignBase API failed: {e}") from e
+
+
+def _get_session(client: OAuth2Client) -> httpx.Client:
+    # pylint: disable=protected-access
+    if client._session is None:
+        client._session = httpx.Client(
+            timeout=15,
+            http2=True,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+    return client._session
+
+
+def _request_headers(
+    client: OAuth2Client, headers: Optional[dict[str, str]] = None
+) -> dict[str, str]:
+    # pylint: disable=protected-access
+    # access_token is public and may be set without connect(), so rebuild the cached
+    # Authorization header whenever the token changed
+    if client._auth_token != client.access_token:
+        client._auth_header = {"Authorization": f"Bearer {client.access_token}"}
+        client._auth_token = client.access_token
+    return {**client._auth_header, **headers} if headers else client._auth_header
+
+
+def _api_request(  # pylint: disable=too-many-arguments
+    client: OAuth2Client,
+    method: str,
+    url: str,
+    *,
+    retry: bool = True,
+    stream: bool = False,
+    headers: Optional[dict[str, str]] = None,
+    **kwargs,
+) -> httpx.Response:
+    # pylint: disable=protected-access
     _ensure_connected(client)
-    headers = cast(dict[str, str], kwargs.pop("headers", {}) or {})
-    # ensure Authorization header present
-    headers.setdefault("Authorization", f"Bearer {client.access_token}")
-    kwargs["headers"] = headers
-    url = f"{BASE_URL}{path.lstrip('/')}"
-    response = requests.request(method=method, url=url, timeout=15, **kwargs)
+    if time.monotonic() >= client._token_expires_at:
+        connect(client)
+    session = _get_session(client)
+    request = session.build_request(
+        method, url, headers=_request_headers(client, headers), **kwargs
+    )
+    with _transport_errors():
+        response = session.send(request, stream=stream)
     # try to reconnect once on unauthorized
     if response.status_code == 401 and retry:
+        response.close()
         try:
             connect(client)
         except Exception:
             # bubble original auth error if reconnect failed
             pass
-        # update header with new token (connect may have set it)
-        headers["Authorization"] = (
-            f"Bearer {client.access_token}"
-            if client.access_token
-            else headers.get("Authorization", "")
+        # connect() replaced the token, so this picks up the new Authorization header
+        request = session.build_request(
+            method, url, headers=_request_headers(client, headers), **kwargs
         )
-        kwargs["headers"] = headers
-        response = requests.request(method=method, url=url, timeout=15, **kwargs)
+        with _transport_errors():
+            response = session.send(request, stream=stream)
     return response
 
 
-def connect(client: OAuth2Client):
+def _get_http(client: OAuth2Client) -> httpx.AsyncClient:
+    # pylint: disable=protected-access
+    if client._http is None:
+        client._http = httpx.AsyncClient(timeout=15, http2=True, follow_redirects=True)
+    return client._http
 
-    _validate(client)
-    auth_credentials = ""
 
-    if client.grant_type == GrantType.AUTHORIZATION_CODE:
-        if not client.user_name or not client.password:
-            raise ESignBaseSDKError(
-                "Username and password are required for authorization code grant type"
-            )
-        auth_credentials = f"username={client.user_name}&password={client.password}&"
-
-    basic_auth_credentials = b64encode(f"{client.id}:{client.secret}".encode()).decode()
-
-    response = requests.post(
-        url=f"{BASE_URL}oauth2/token",
-        data=f"{auth_credentials}grant_type={client.grant_type}&scope={' '.join(client.scope)}",
-        headers={
-            "Authorization": f"Basic {basic_auth_credentials}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        },
-        timeout=15,
-    )
-    if not response.ok:
-        raise ESignBaseSDKError(
-            f"Failed to connect to ESignBase API: {response.text}",
-            status_code=response.status_code,
+def _get_refresh_lock(client: OAuth2Client) -> asyncio.Lock:
+    # pylint: disable=protected-access
+    if client._refresh_lock is None:
+        client._refresh_lock = asyncio.Lock()
+    return client._refresh_lock
+
+
+async def _arefresh_token(client: OAuth2Client, stale_token: Optional[str], only_if_expired: bool):
+    # pylint: disable=protected-access
+    # concurrent requests share one refresh: whoever gets the lock first reconnects, the
+    # others find a new token (or a new deadline) afterwards and reuse it
+    async with _get_refresh_lock(client):
+        if client.access_token != stale_token:
+            return
+        if only_if_expired and time.monotonic() < client._token_expires_at:
+            return
+        await aconnect(client)
+
+
+async def _api_request_async(  # pylint: disable=too-many-arguments
+    client: OAuth2Client,
+    method: str,
+    url: str,
+    *,
+    retry: bool = True,
+    stream: bool = False,
+    headers: Optional[dict[str, str]] = None,
+    **kwargs,
+) -> httpx.Response:
+    # pylint: disable=protected-access
+    _ensure_connected(client)
+    if time.monotonic() >= client._token_expires_at:
+        await _arefresh_token(client, client.access_token, only_if_expired=True)
+    token = client.access_token
+    http = _get_http(client)
+    request = http.build_request(method, url, headers=_request_headers(client, headers), **kwargs)
+    with _transport_errors():
+        response = await http.send(request, stream=stream)
+    # try to reconnect once on unauthorized
+    if response.status_code == 401 and retry:
+        await response.aclose()
+        try:
+            await _arefresh_token(client, token, only_if_expired=False)
+        except Exception:
+            # bubble original auth error if reconnect failed
+            pass
+        # the refresh replaced the token, so this picks up the new Authorization header
+        request = http.build_request(
+            method, url, headers=_request_headers(client, headers), **kwargs
         )
-    client.access_token = response.json().get("access_token")
+        with _transport_errors():
+            response = await http.send(request, stream=stream)
+    return response
+
+
+def _parse_response(response: httpx.Response, error_message: str) -> Any:
+    if not response.is_success:
+        raise ESignBaseSDKError.from_response(error_message, response)
+    return orjson.loads(response.content)
+
+
+def _token_request(client: OAuth2Client) -> tuple[bytes, dict[str, str]]:
+    # pylint: disable=protected-access
+    # grant_type may have been reassigned to a plain string after construction
+    grant_type = GrantType(client.grant_type)
+    # reconnects reuse the validated and encoded credentials; they are checked and rebuilt
+    # whenever one of the credential fields of the (mutable) client changed
+    key = (
+        client.id,
+        client.secret,
+        grant_type,
+        client.user_name,
+        client.password,
+        tuple(client.scope),
+    )
+    if client._token_key != key:
+        client._validated = False
+    if not client._validated:
+        _validate(client)
+    body, basic_auth_header = client._token_body, client._basic_auth_header
+    if client._token_key != key or body is None or basic_auth_header is None:
+        credentials = f"{client.id}:{client.secret}".encode()
+        basic_auth_credentials = b2a_base64(credentials, newline=False).decode("ascii")
+        basic_auth_header = f"Basic {basic_auth_credentials}"
+
+        payload: dict[str, str] = {}
+        if grant_type is GrantType.AUTHORIZATION_CODE:
+            if not client.user_name or not client.password:
+                raise ESignBaseSDKError(
+                    "Username and password are required for authorization code grant type"
+                )
+            payload["username"] = client.user_name
+            payload["password"] = client.password
+        payload["grant_type"] = grant_type
+        payload["scope"] = " ".join(client.scope)
+        body = urlencode(payload).encode("ascii")
+
+        client._token_key = key
+        client._token_body = body
+        client._basic_auth_header = basic_auth_header
+
+    headers = {
+        "Authorization": basic_auth_header,
+        "Content-Type": "application/x-www-form-urlencoded",
+    }
+    return body, headers
+
+
+def _set_token(client: OAuth2Client, content: bytes):
+    # pylint: disable=protected-access
+    token = orjson.loads(content)
+    client.access_token = token.get("access_token")
+    client._validated = True
+    # without expires_in only a 401 response triggers a reconnect
+    expires_in = token.get("expires_in")
+    if expires_in:
+        expires_in = int(expires_in)
+        # short lived tokens are refreshed halfway through instead of before every request
+        lifetime = max(expires_in - TOKEN_EXPIRY_MARGIN, expires_in / 2)
+        client._token_expires_at = time.monotonic() + lifetime
+    else:
+        client._token_expires_at = math.inf
+
+
+def connect(client: OAuth2Client):
+    data, headers = _token_request(client)
+    with _transport_errors():
+        response = _get_session(client).post(_TOKEN_URL, content=data, headers=headers)
+    if not response.is_success:
+        raise ESignBaseSDKError.from_response("Failed to connect to ESignBase API", response)
+    _set_token(client, response.content)
+
+
+def close(client: OAuth2Client) -> None:
+    # pylint: disable=protected-access
+    if client._session is not None:
+        client._session.close()
+        client._session = None
 
 
 def get_templates(client: OAuth2Client) -> list[dict[str, Any]]:
-    response = _api_request(client, "get", "api/templates")
-    if not response.ok:
-        raise ESignBaseSDKError(f"Failed to get templates: {response.text}")
-    return response.json()
+    response = _api_request(client, "get", _TEMPLATES_URL)
+    return _parse_response(response, "Failed to get templates")
 
 
 def get_template(client: OAuth2Client, template_id: str) -> dict[str, Any]:
-    response = _api_request(client, "get", f"api/template/{template_id}")
-    if not response.ok:
-        raise ESignBaseSDKError(
-            f"Failed to get template: {response.text}", status_code=response.status_code
-        )
-    return response.json()
+    response = _api_request(client, "get", _TEMPLATE_URL_PREFIX + template_id)
+    return _parse_response(response, "Failed to get template")
 
 
 def get_documents(client: OAuth2Client, limit: int, offset: int) -> dict[str, Any]:
     response = _api_request(
-        client, "get", "api/documents", params={"limit": limit, "offset": offset}
+        client, "get", _DOCUMENTS_URL, params={"limit": limit, "offset": offset}
     )
-    if not response.ok:
-        raise ESignBaseSDKError(
-            f"Failed to get documents: {response.text}",
-            status_code=response.status_code,
-        )
-    return response.json()
+    return _parse_response(response, "Failed to get documents")
 
 
 def get_document(client: OAuth2Client, document_id: str) -> dict[str, Any]:
-    response = _api_request(client, "get", f"api/document/{document_id}")
-    if not response.ok:
-        raise ESignBaseSDKError(
-            f"Failed to get document: {response.text}", status_code=response.status_code
-        )
-    return response.json()
+    response = _api_request(client, "get", _DOCUMENT_URL_PREFIX + document_id)
+    return _parse_response(response, "Failed to get document")
 
 
-def create_document(  # pylint: disable=too-many-arguments
-    client: OAuth2Client,
-    *,
+def get_documents_bulk(
+    client: OAuth2Client, document_ids: list[str], *, batch_size: int = BULK_BATCH_SIZE
+) -> list[dict[str, Any]]:
+    return asyncio.run(_get_documents_bulk(client, document_ids, batch_size))
+
+
+async def _get_documents_bulk(
+    client: OAuth2Client, document_ids: list[str], batch_size: int
+) -> list[dict[str, Any]]:
+    # pylint: disable=protected-access
+    # an AsyncClient (and the refresh lock) is bound to the event loop it was first used on, so
+    # asyncio.run() gets its own and leaves the ones used by the async functions alone
+    http, client._http = client._http, None
+    refresh_lock, client._refresh_lock = client._refresh_lock, None
+    try:
+        return await aget_documents_bulk(client, document_ids, batch_size=batch_size)
+    finally:
+        await aclose(client)
+        client._http = http
+        client._refresh_lock = refresh_lock
+
+
+def _document_request_data(
     template_id: str,
     document_name: str,
     recipients: list[Recipient],
-    user_defined_metadata: Optional[dict[str, str | int]] = None,
-    expiration_date: Optional[datetime] = None,
+    user_defined_metadata: Optional[dict[str, str | int]],
+    expiration_date: Optional[datetime],
 ) -> dict[str, Any]:
     request_data: dict[str, Any] = {
         "name": document_name,
         "template_id": template_id,
-        "recipients": [
-            {
-                "email": r.email,
-                "first_name": r.first_name,
-                "last_name": r.last_name,
-                "role_name": r.role_name,
-                "locale": r.locale,
-            }
-            for r in recipients
-        ],
+        # orjson serializes dataclasses natively, field names become the JSON keys
+        "recipients": recipients,
     }
 
     if user_defined_metadata:
         request_data["user_defined_metadata"] = user_defined_metadata
 
     if expiration_date:
-        # ensure expiration_date is timezone-aware; assume UTC for naive datetimes
-        if expiration_date.tzinfo is None:
-            expiration_date = expiration_date.replace(tzinfo=timezone.utc)
-        request_data["expiration_date"] = expiration_date.strftime("%Y-%m-%dT%H:%M:%S%z")
+        # naive datetimes are treated as UTC; UTC needs no strftime offset lookup
+        if not expiration_date.utcoffset():
+            timestamp = expiration_date.isoformat(timespec="seconds")[:19]
+            request_data["expiration_date"] = f"{timestamp}+0000"
+        else:
+            request_data["expiration_date"] = expiration_date.strftime("%Y-%m-%dT%H:%M:%S%z")
+    return request_data
+
 
+def create_document(  # pylint: disable=too-many-arguments
+    client: OAuth2Client,
+    *,
+    template_id: str,
+    document_name: str,
+    recipients: list[Recipient],
+    user_defined_metadata: Optional[dict[str, str | int]] = None,
+    expiration_date: Optional[datetime] = None,
+) -> dict[str, Any]:
+    request_data = _document_request_data(
+        template_id, document_name, recipients, user_defined_metadata, expiration_date
+    )
     response = _api_request(
         client,
         "post",
-        "api/document",
-        json=request_data,
+        _DOCUMENT_URL,
+        content=orjson.dumps(request_data),
         headers={"Content-Type": "application/json"},
     )
-    if not response.ok:
-        raise ESignBaseSDKError(
-            f"Failed to create document: {response.text}",
-            status_code=response.status_code,
-        )
-    return response.json()
-
+    return _parse_response(response, "Failed to create document")
 
-def download_document(client: OAuth2Client, document_id: str) -> Generator[bytes]:
-    response = _api_request(client, "get", f"api/document/{document_id}/download", stream=True)
-    if not response.ok:
-        raise ESignBaseSDKError(
-            f"Failed to download document: {response.text}",
-            status_code=response.status_code,
-        )
 
-    yield from response.iter_content(chunk_size=8192)
+def download_document(
+    client: OAuth2Client, document_id: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE
+) -> Generator[bytes]:
+    response = _api_request(
+        client, "get", f"{_DOCUMENT_URL_PREFIX}{document_id}/download", stream=True
+    )
+    try:
+        with _transport_errors():
+            if not response.is_success:
+                response.read()
+                raise ESignBaseSDKError.from_response("Failed to download document", response)
+            yield from response.iter_bytes(chunk_size=chunk_size)
+    finally:
+        response.close()
 
 
 def delete_document(client: OAuth2Client, document_id: str) -> None:
-    response = _api_request(client, "delete", f"api/document/{document_id}")
-    if not response.ok:
-        raise ESignBaseSDKError(
-            f"Failed to delete document: {response.text}",
-            status_code=response.status_code,
-        )
+    response = _api_request(client, "delete", _DOCUMENT_URL_PREFIX + document_id)
+    if not response.is_success:
+        raise ESignBaseSDKError.from_response("Failed to delete document", response)
 
 
 def get_credits(client: OAuth2Client) -> dict[str, Any]:
-    response = _api_request(client, "get", "api/credits")
-    if not response.ok:
-        raise ESignBaseSDKError(
-            f"Failed to get credits: {response.text}", status_code=response.status_code
-        )
-    return response.json()
+    response = _api_request(client, "get", _CREDITS_URL)
+    return _parse_response(response, "Failed to get credits")
+
+
+async def aconnect(client: OAuth2Client):
+    data, headers = _token_request(client)
+    with _transport_errors():
+        response = await _get_http(client).post(_TOKEN_URL, content=data, headers=headers)
+    if not response.is_success:
+        raise ESignBaseSDKError.from_response("Failed to connect to ESignBase API", response)
+    _set_token(client, response.content)
+
+
+async def aclose(client: OAuth2Client) -> None:
+    # pylint: disable=protected-access
+    if client._http is not None:
+        await client._http.aclose()
+        client._http = None
+    client._refresh_lock = None
+
+
+async def aget_templates(client: OAuth2Client) -> list[dict[str, Any]]:
+    response = await _api_request_async(client, "GET", _TEMPLATES_URL)
+    return _parse_response(response, "Failed to get templates")
+
+
+async def aget_template(client: OAuth2Client, template_id: str) -> dict[str, Any]:
+    response = await _api_request_async(client, "GET", _TEMPLATE_URL_PREFIX + template_id)
+    return _parse_response(response, "Failed to get template")
+
+
+async def aget_documents(client: OAuth2Client, limit: int, offset: int) -> dict[str, Any]:
+    response = await _api_request_async(
+        client, "GET", _DOCUMENTS_URL, params={"limit": limit, "offset": offset}
+    )
+    return _parse_response(response, "Failed to get documents")
+
+
+async def aget_document(client: OAuth2Client, document_id: str) -> dict[str, Any]:
+    response = await _api_request_async(client, "GET", _DOCUMENT_URL_PREFIX + document_id)
+    return _parse_response(response, "Failed to get document")
+
+
+async def acreate_document(  # pylint: disable=too-many-arguments
+    client: OAuth2Client,
+    *,
+    template_id: str,
+    document_name: str,
+    recipients: list[Recipient],
+    user_defined_metadata: Optional[dict[str, str | int]] = None,
+    expiration_date: Optional[datetime] = None,
+) -> dict[str, Any]:
+    request_data = _document_request_data(
+        template_id, document_name, recipients, user_defined_metadata, expiration_date
+    )
+    response = await _api_request_async(
+        client,
+        "POST",
+        _DOCUMENT_URL,
+        content=orjson.dumps(request_data),
+        headers={"Content-Type": "application/json"},
+    )
+    return _parse_response(response, "Failed to create document")
+
+
+async def adownload_document(
+    client: OAuth2Client, document_id: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE
+) -> AsyncGenerator[bytes]:
+    response = await _api_request_async(
+        client, "GET", f"{_DOCUMENT_URL_PREFIX}{document_id}/download", stream=True
+    )
+    try:
+        with _transport_errors():
+            if not response.is_success:
+                await response.aread()
+                raise ESignBaseSDKError.from_response("Failed to download document", response)
+            async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                yield chunk
+    finally:
+        await response.aclose()
+
+
+async def adelete_document(client: OAuth2Client, document_id: str) -> None:
+    response = await _api_request_async(client, "DELETE", _DOCUMENT_URL_PREFIX + document_id)
+    if not response.is_success:
+        raise ESignBaseSDKError.from_response("Failed to delete document", response)
+
+
+async def aget_credits(client: OAuth2Client) -> dict[str, Any]:
+    response = await _api_request_async(client, "GET", _CREDITS_URL)
+    return _parse_response(response, "Failed to get credits")
+
+
+async def aget_documents_bulk(
+    client: OAuth2Client, document_ids: list[str], *, batch_size: int = BULK_BATCH_SIZE
+) -> list[dict[str, Any]]:
+    if batch_size < 1:
+        # a semaphore with no slots would never let a request through
+        raise ESignBaseSDKError("batch_size must be at least 1")
+    semaphore = asyncio.Semaphore(batch_size)
+
+    async def get_one(document_id: str) -> dict[str, Any]:
+        async with semaphore:
+            return await aget_document(client, document_id)
+
+    tasks = [asyncio.ensure_future(get_one(i)) for i in document_ids]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        # gather() leaves the other fetches running; stop them before the error propagates so
+        # none of them still uses the AsyncClient that get_documents_bulk closes afterwards
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
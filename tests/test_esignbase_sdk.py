@@ -1,8 +1,12 @@
 # pylint: disable=protected-access
-from datetime import datetime
-from unittest import TestCase
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest import IsolatedAsyncioTestCase, TestCase
 from unittest.mock import Mock, patch
 
+import httpx
+import orjson
+
 import esignbase_sdk
 
 
@@ -20,6 +24,11 @@ class TestEsignBaseSDK(TestCase):
         self.assertEqual(client.grant_type, esignbase_sdk.GrantType.CLIENT_CREDENTIALS)
         self.assertEqual(client.scope, [esignbase_sdk.Scope.ALL])
 
+        client = esignbase_sdk.OAuth2Client(
+            id="test_id", secret="test_secret", grant_type="authorization_code"  # type: ignore
+        )
+        self.assertIs(client.grant_type, esignbase_sdk.GrantType.AUTHORIZATION_CODE)
+
     def test_validate_requires_scope_and_credentials(self):
         # missing scope
         client = esignbase_sdk.OAuth2Client(
@@ -51,11 +60,11 @@ class TestEsignBaseSDK(TestCase):
         with self.assertRaises(esignbase_sdk.ESignBaseSDKError):
             esignbase_sdk._validate(client)
 
-    @patch("esignbase_sdk.requests.post")
+    @patch.object(esignbase_sdk.httpx.Client, "post")
     def test_connect_sets_access_token_on_success(self, post_mock: Mock):
         mock_resp = Mock()
-        mock_resp.ok = True
-        mock_resp.json.return_value = {"access_token": "abc123"}
+        mock_resp.is_success = True
+        mock_resp.content = orjson.dumps({"access_token": "abc123", "expires_in": 3600})
         post_mock.return_value = mock_resp
 
         client = esignbase_sdk.OAuth2Client(
@@ -66,12 +75,152 @@ class TestEsignBaseSDK(TestCase):
         )
         esignbase_sdk.connect(client)
         self.assertEqual(client.access_token, "abc123")
+        self.assertLessEqual(
+            client._token_expires_at,
+            esignbase_sdk.time.monotonic() + 3600 - esignbase_sdk.TOKEN_EXPIRY_MARGIN,
+        )
+        self.assertEqual(client._auth_header, {})
+        headers = esignbase_sdk._request_headers(client)
+        self.assertEqual(headers, {"Authorization": "Bearer abc123"})
+        self.assertIs(esignbase_sdk._request_headers(client), headers)
+        esignbase_sdk.close(client)
+        self.assertIsNone(client._session)
+
+    def test_set_token_refreshes_short_lived_tokens_halfway(self):
+        client = esignbase_sdk.OAuth2Client(
+            id="id",
+            secret="secret",
+            grant_type=esignbase_sdk.GrantType.CLIENT_CREDENTIALS,
+            scope=[esignbase_sdk.Scope.ALL],
+        )
+        before = esignbase_sdk.time.monotonic()
+        esignbase_sdk._set_token(client, orjson.dumps({"access_token": "t", "expires_in": 20}))
+        self.assertGreaterEqual(client._token_expires_at, before + 10)
+
+        esignbase_sdk._set_token(client, orjson.dumps({"access_token": "t"}))
+        self.assertEqual(client._token_expires_at, esignbase_sdk.math.inf)
+
+    @patch.object(esignbase_sdk.httpx.Client, "post")
+    def test_connect_url_encodes_token_request(self, post_mock: Mock):
+        mock_resp = Mock()
+        mock_resp.is_success = True
+        mock_resp.content = orjson.dumps({"access_token": "abc123"})
+        post_mock.return_value = mock_resp
+
+        client = esignbase_sdk.OAuth2Client(
+            id="id",
+            secret="secret",
+            grant_type=esignbase_sdk.GrantType.AUTHORIZATION_CODE,
+            user_name="user@example.com",
+            password="p&ss=word",
+            scope=[esignbase_sdk.Scope.READ, esignbase_sdk.Scope.DELETE],
+        )
+        esignbase_sdk.connect(client)
+        self.assertTrue(client._validated)
+        with patch("esignbase_sdk._validate") as validate_mock:
+            esignbase_sdk.connect(client)
+        validate_mock.assert_not_called()
+
+        _, kwargs = post_mock.call_args
+        self.assertEqual(
+            kwargs["content"],
+            b"username=user%40example.com&password=p%26ss%3Dword"
+            b"&grant_type=authorization_code&scope=read+delete",
+        )
+        self.assertEqual(kwargs["headers"]["Authorization"], "Basic aWQ6c2VjcmV0")
+
+    @patch.object(esignbase_sdk.httpx.Client, "post")
+    def test_connect_accepts_grant_type_reassigned_as_string(self, post_mock: Mock):
+        mock_resp = Mock()
+        mock_resp.is_success = True
+        mock_resp.content = orjson.dumps({"access_token": "abc123"})
+        post_mock.return_value = mock_resp
+
+        client = esignbase_sdk.OAuth2Client(
+            id="id",
+            secret="secret",
+            grant_type=esignbase_sdk.GrantType.CLIENT_CREDENTIALS,
+            scope=[esignbase_sdk.Scope.READ],
+        )
+        client.grant_type = "authorization_code"  # type: ignore
+        client.user_name = "user"
+        client.password = "pass"
+        esignbase_sdk.connect(client)
+
+        _, kwargs = post_mock.call_args
+        self.assertEqual(
+            kwargs["content"],
+            b"username=user&password=pass&grant_type=authorization_code&scope=read",
+        )
+
+    def test_connect_uses_corrected_credentials(self):
+        token_requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            token_requests.append(request)
+            if request.headers["Authorization"] != "Basic aWQ6Z29vZA==":  # id:good
+                return httpx.Response(401, text="invalid client")
+            return httpx.Response(200, content=orjson.dumps({"access_token": "abc123"}))
+
+        client = esignbase_sdk.OAuth2Client(
+            id="id",
+            secret="typo",
+            grant_type=esignbase_sdk.GrantType.CLIENT_CREDENTIALS,
+            scope=[esignbase_sdk.Scope.READ],
+        )
+        client._session = httpx.Client(transport=httpx.MockTransport(handler))
+        with self.assertRaises(esignbase_sdk.ESignBaseSDKError):
+            esignbase_sdk.connect(client)
+        self.assertFalse(client._validated)
+
+        client.secret = "good"
+        client.scope = [esignbase_sdk.Scope.ALL]
+        esignbase_sdk.connect(client)
+        self.assertEqual(client.access_token, "abc123")
+        self.assertTrue(client._validated)
+        self.assertEqual(token_requests[-1].content, b"grant_type=client_credentials&scope=all")
+
+        # changed credentials are validated again before they are sent
+        client.scope = []
+        with self.assertRaises(esignbase_sdk.ESignBaseSDKError):
+            esignbase_sdk.connect(client)
+        self.assertEqual(len(token_requests), 2)
+
+    def test_clients_follow_redirects(self):
+        client = esignbase_sdk.OAuth2Client(
+            id="id",
+            secret="secret",
+            grant_type=esignbase_sdk.GrantType.CLIENT_CREDENTIALS,
+            scope=[esignbase_sdk.Scope.ALL],
+        )
+        self.assertTrue(esignbase_sdk._get_session(client).follow_redirects)
+        self.assertTrue(esignbase_sdk._get_http(client).follow_redirects)
+
+    def test_transport_errors_raise_sdk_error(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection refused", request=request)
+
+        client = esignbase_sdk.OAuth2Client(
+            id="id",
+            secret="secret",
+            grant_type=esignbase_sdk.GrantType.CLIENT_CREDENTIALS,
+            scope=[esignbase_sdk.Scope.ALL],
+        )
+        client._session = httpx.Client(transport=httpx.MockTransport(handler))
+        with self.assertRaises(esignbase_sdk.ESignBaseSDKError) as ctx:
+            esignbase_sdk.connect(client)
+        self.assertIsInstance(ctx.exception.__cause__, httpx.ConnectError)
 
-    @patch("esignbase_sdk.requests.post")
+        client.access_token = "tkn"
+        with self.assertRaises(esignbase_sdk.ESignBaseSDKError) as ctx:
+            esignbase_sdk.get_credits(client)
+        self.assertIsInstance(ctx.exception.__cause__, httpx.ConnectError)
+
+    @patch.object(esignbase_sdk.httpx.Client, "post")
     def test_connect_raises_on_http_error(self, post_mock: Mock):
         mock_resp = Mock()
-        mock_resp.ok = False
-        mock_resp.text = "bad"
+        mock_resp.is_success = False
+        mock_resp.content = b"bad"
         post_mock.return_value = mock_resp
 
         client = esignbase_sdk.OAuth2Client(
@@ -83,12 +232,12 @@ class TestEsignBaseSDK(TestCase):
         with self.assertRaises(esignbase_sdk.ESignBaseSDKError):
             esignbase_sdk.connect(client)
 
-    @patch("esignbase_sdk.requests.request")
+    @patch.object(esignbase_sdk.httpx.Client, "send")
     def test_get_templates_success_and_error(self, get_mock: Mock):
         # success
         mock_resp = Mock()
-        mock_resp.ok = True
-        mock_resp.json.return_value = []
+        mock_resp.is_success = True
+        mock_resp.content = orjson.dumps([])
         get_mock.return_value = mock_resp
 
         client = esignbase_sdk.OAuth2Client(
@@ -103,13 +252,23 @@ class TestEsignBaseSDK(TestCase):
 
         # error
         mock_resp = Mock()
-        mock_resp.ok = False
-        mock_resp.text = "err"
+        mock_resp.is_success = False
+        mock_resp.content = b"err"
         get_mock.return_value = mock_resp
 
         with self.assertRaises(esignbase_sdk.ESignBaseSDKError):
             esignbase_sdk.get_templates(client)
 
+    def test_error_from_response_truncates_body(self):
+        response = httpx.Response(502, content=b"x" * 2048)
+        error = esignbase_sdk.ESignBaseSDKError.from_response("Failed to get templates", response)
+        self.assertEqual(error.status_code, 502)
+        self.assertIs(error.response, response)
+        self.assertEqual(
+            str(error), "Failed to get templates: " + "x" * esignbase_sdk.ERROR_BODY_LIMIT
+        )
+        self.assertEqual(str(esignbase_sdk.ESignBaseSDKError("plain")), "plain")
+
     def test_validate_auth_code_requires_credentials(self):
         client = esignbase_sdk.OAuth2Client(
             id="id",
@@ -120,11 +279,11 @@ class TestEsignBaseSDK(TestCase):
         with self.assertRaises(esignbase_sdk.ESignBaseSDKError):
             esignbase_sdk._validate(client)
 
-    @patch("esignbase_sdk.requests.request")
+    @patch.object(esignbase_sdk.httpx.Client, "send")
     def test_create_document_includes_metadata_and_expiration(self, request_mock: Mock):
         mock_resp = Mock()
-        mock_resp.ok = True
-        mock_resp.json.return_value = {"id": "doc1"}
+        mock_resp.is_success = True
+        mock_resp.content = orjson.dumps({"id": "doc1"})
         request_mock.return_value = mock_resp
 
         client = esignbase_sdk.OAuth2Client(
@@ -152,22 +311,49 @@ class TestEsignBaseSDK(TestCase):
         )
 
         self.assertEqual(res, {"id": "doc1"})
-        # inspect the json payload passed to requests.request
-        _, kwargs = request_mock.call_args
-        json_payload = kwargs.get("json")
-        self.assertIsNotNone(json_payload)
+        # inspect the request passed to Client.send
+        request: httpx.Request = request_mock.call_args.args[0]
+        json_payload = orjson.loads(request.content)
+        self.assertEqual(request.headers["Content-Type"], "application/json")
+        self.assertEqual(request.headers["Authorization"], "Bearer tkn")
         self.assertEqual(json_payload["user_defined_metadata"], {"k": "v", "n": 1})
         self.assertEqual(json_payload["name"], "Doc")
         self.assertEqual(json_payload["template_id"], "tpl")
-        self.assertEqual(json_payload["recipients"][0]["email"], "a@a.com")
-        self.assertTrue(json_payload["expiration_date"].endswith("+0000"))
+        self.assertEqual(
+            json_payload["recipients"],
+            [
+                {
+                    "email": "a@a.com",
+                    "first_name": "A",
+                    "last_name": "B",
+                    "role_name": "Signer",
+                    "locale": "en",
+                }
+            ],
+        )
+        self.assertEqual(json_payload["expiration_date"], "2025-01-01T12:00:00+0000")
 
-    @patch("esignbase_sdk.requests.request")
+    def test_document_request_data_formats_expiration_offset(self):
+        def expiration(value: datetime) -> str:
+            return esignbase_sdk._document_request_data("tpl", "Doc", [], None, value)[
+                "expiration_date"
+            ]
+
+        self.assertEqual(
+            expiration(datetime(2025, 1, 1, 12, 0, 0, 500, tzinfo=timezone.utc)),
+            "2025-01-01T12:00:00+0000",
+        )
+        self.assertEqual(
+            expiration(datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone(timedelta(hours=2)))),
+            "2025-01-01T12:00:00+0200",
+        )
+
+    @patch.object(esignbase_sdk.httpx.Client, "send")
     def test_download_document_streams_and_errors(self, request_mock: Mock):
         # success streaming
         mock_resp = Mock()
-        mock_resp.ok = True
-        mock_resp.iter_content = Mock(return_value=[b"part1", b"part2"])
+        mock_resp.is_success = True
+        mock_resp.iter_bytes = Mock(return_value=[b"part1", b"part2"])
         request_mock.return_value = mock_resp
 
         client = esignbase_sdk.OAuth2Client(
@@ -177,28 +363,30 @@ class TestEsignBaseSDK(TestCase):
             scope=[esignbase_sdk.Scope.ALL],
         )
         client.access_token = "tkn"
-        chunks = list(esignbase_sdk.download_document(client, "docid"))
+        chunks = list(esignbase_sdk.download_document(client, "docid", chunk_size=1024))
         self.assertEqual(b"".join(chunks), b"part1part2")
+        mock_resp.iter_bytes.assert_called_once_with(chunk_size=1024)
+        mock_resp.close.assert_called_once()
 
         # error case
         mock_resp = Mock()
-        mock_resp.ok = False
-        mock_resp.text = "err"
+        mock_resp.is_success = False
+        mock_resp.content = b"err"
         request_mock.return_value = mock_resp
         with self.assertRaises(esignbase_sdk.ESignBaseSDKError):
             list(esignbase_sdk.download_document(client, "docid"))
 
     @patch("esignbase_sdk.connect")
-    @patch("esignbase_sdk.requests.request")
+    @patch.object(esignbase_sdk.httpx.Client, "send")
     def test_api_request_reconnects_on_401(self, request_mock: Mock, connect_mock: Mock):
         # prepare responses: first is 401, second is successful
         resp1 = Mock()
         resp1.status_code = 401
-        resp1.ok = False
+        resp1.is_success = False
         resp2 = Mock()
         resp2.status_code = 200
-        resp2.ok = True
-        resp2.json.return_value = {"ok": True}
+        resp2.is_success = True
+        resp2.content = orjson.dumps({"ok": True})
         request_mock.side_effect = [resp1, resp2]
 
         def do_connect(c):
@@ -214,17 +402,97 @@ class TestEsignBaseSDK(TestCase):
         )
         client.access_token = "oldtoken"
 
-        res = esignbase_sdk._api_request(client, "get", "api/something")
+        res = esignbase_sdk._api_request(client, "get", f"{esignbase_sdk.BASE_URL}api/something")
         self.assertIs(res, resp2)
         self.assertEqual(request_mock.call_count, 2)
         self.assertEqual(client.access_token, "newtoken")
+        first, second = (c.args[0] for c in request_mock.call_args_list)
+        self.assertEqual(first.headers["Authorization"], "Bearer oldtoken")
+        self.assertEqual(second.headers["Authorization"], "Bearer newtoken")
 
-    @patch("esignbase_sdk.requests.request")
+    @patch("esignbase_sdk.connect")
+    @patch.object(esignbase_sdk.httpx.Client, "send")
+    def test_api_request_refreshes_expired_token(self, request_mock: Mock, connect_mock: Mock):
+        resp = Mock()
+        resp.status_code = 200
+        resp.is_success = True
+        request_mock.return_value = resp
+
+        def do_connect(c):
+            c.access_token = "newtoken"
+            c._token_expires_at = esignbase_sdk.math.inf
+
+        connect_mock.side_effect = do_connect
+
+        client = esignbase_sdk.OAuth2Client(
+            id="id",
+            secret="secret",
+            grant_type=esignbase_sdk.GrantType.CLIENT_CREDENTIALS,
+            scope=[esignbase_sdk.Scope.ALL],
+        )
+        client.access_token = "oldtoken"
+        client._token_expires_at = 0
+
+        res = esignbase_sdk._api_request(client, "get", f"{esignbase_sdk.BASE_URL}api/something")
+        self.assertIs(res, resp)
+        connect_mock.assert_called_once_with(client)
+        self.assertEqual(request_mock.call_count, 1)
+        request: httpx.Request = request_mock.call_args.args[0]
+        self.assertEqual(request.headers["Authorization"], "Bearer newtoken")
+
+    def test_get_documents_bulk_uses_own_async_client_and_refreshes_once(self):
+        token_requests: list[httpx.Request] = []
+        document_requests: list[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/oauth2/token":
+                token_requests.append(request)
+                # let the other requests of the batch run into the expired token meanwhile
+                await asyncio.sleep(0.01)
+                return httpx.Response(
+                    200, content=orjson.dumps({"access_token": "newtoken", "expires_in": 3600})
+                )
+            document_requests.append(request)
+            self.assertEqual(request.headers["Authorization"], "Bearer newtoken")
+            document_id = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, content=orjson.dumps({"id": document_id}))
+
+        def pooled_handler(request: httpx.Request) -> httpx.Response:
+            raise AssertionError(f"pooled AsyncClient used for {request.url}")
+
+        client = esignbase_sdk.OAuth2Client(
+            id="id",
+            secret="secret",
+            grant_type=esignbase_sdk.GrantType.CLIENT_CREDENTIALS,
+            scope=[esignbase_sdk.Scope.ALL],
+        )
+        client.access_token = "oldtoken"
+        client._token_expires_at = 0
+        pooled = httpx.AsyncClient(transport=httpx.MockTransport(pooled_handler))
+        client._http = pooled
+
+        async_client = httpx.AsyncClient
+        with patch.object(
+            esignbase_sdk.httpx,
+            "AsyncClient",
+            lambda **kwargs: async_client(transport=httpx.MockTransport(handler), **kwargs),
+        ):
+            ids = [f"d{i}" for i in range(20)]
+            res = esignbase_sdk.get_documents_bulk(client, ids, batch_size=5)
+
+        self.assertEqual(res, [{"id": i} for i in ids])
+        self.assertEqual(len(token_requests), 1)
+        self.assertEqual(len(document_requests), 20)
+        self.assertIs(client._http, pooled)
+        self.assertFalse(pooled.is_closed)
+        self.assertIsNone(client._refresh_lock)
+
+    @patch.object(esignbase_sdk.httpx.Client, "send")
     def test_get_template_documents_and_credits_error_and_success(self, request_mock: Mock):
         # success template
         mock_resp = Mock()
-        mock_resp.ok = True
-        mock_resp.json.return_value = {"template": 1}
+        mock_resp.is_success = True
+        mock_resp.content = orjson.dumps({"template": 1})
         request_mock.return_value = mock_resp
 
         client = esignbase_sdk.OAuth2Client(
@@ -238,39 +506,187 @@ class TestEsignBaseSDK(TestCase):
 
         # error cases for get_template
         mock_resp = Mock()
-        mock_resp.ok = False
-        mock_resp.text = "err"
+        mock_resp.is_success = False
+        mock_resp.content = b"err"
         mock_resp.status_code = 500
         request_mock.return_value = mock_resp
         with self.assertRaises(esignbase_sdk.ESignBaseSDKError):
             esignbase_sdk.get_template(client, "t1")
 
         # documents success
-        mock_resp.ok = True
-        mock_resp.json.return_value = {"docs": []}
+        mock_resp.is_success = True
+        mock_resp.content = orjson.dumps({"docs": []})
         request_mock.return_value = mock_resp
         self.assertEqual(esignbase_sdk.get_documents(client, 10, 0), {"docs": []})
 
         # document error
-        mock_resp.ok = False
-        mock_resp.text = "err"
+        mock_resp.is_success = False
+        mock_resp.content = b"err"
         request_mock.return_value = mock_resp
         with self.assertRaises(esignbase_sdk.ESignBaseSDKError):
             esignbase_sdk.get_documents(client, 1, 0)
 
         # get_document success
-        mock_resp.ok = True
-        mock_resp.json.return_value = {"doc": 1}
+        mock_resp.is_success = True
+        mock_resp.content = orjson.dumps({"doc": 1})
         request_mock.return_value = mock_resp
         self.assertEqual(esignbase_sdk.get_document(client, "d1"), {"doc": 1})
 
         # delete_document success
-        mock_resp.ok = True
+        mock_resp.is_success = True
         request_mock.return_value = mock_resp
         self.assertIsNone(esignbase_sdk.delete_document(client, "d1"))
 
         # get_credits success
-        mock_resp.ok = True
-        mock_resp.json.return_value = {"credits": 5}
+        mock_resp.is_success = True
+        mock_resp.content = orjson.dumps({"credits": 5})
         request_mock.return_value = mock_resp
         self.assertEqual(esignbase_sdk.get_credits(client), {"credits": 5})
+
+
+class TestEsignBaseSDKAsync(IsolatedAsyncioTestCase):
+
+    def _client(self, handler) -> esignbase_sdk.OAuth2Client:
+        client = esignbase_sdk.OAuth2Client(
+            id="id",
+            secret="secret",
+            grant_type=esignbase_sdk.GrantType.CLIENT_CREDENTIALS,
+            scope=[esignbase_sdk.Scope.ALL],
+        )
+        client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+
+    async def test_aget_document_success_and_error(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/document/d1":
+                self.assertEqual(request.headers["Authorization"], "Bearer tkn")
+                return httpx.Response(200, content=orjson.dumps({"doc": 1}))
+            return httpx.Response(404, text="missing")
+
+        client = self._client(handler)
+        client.access_token = "tkn"
+        self.assertEqual(await esignbase_sdk.aget_document(client, "d1"), {"doc": 1})
+        with self.assertRaises(esignbase_sdk.ESignBaseSDKError) as ctx:
+            await esignbase_sdk.aget_document(client, "d2")
+        self.assertEqual(ctx.exception.status_code, 404)
+        self.assertEqual(str(ctx.exception), "Failed to get document: missing")
+        await esignbase_sdk.aclose(client)
+        self.assertIsNone(client._http)
+
+    async def test_api_request_async_reconnects_on_401(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/oauth2/token":
+                return httpx.Response(200, content=orjson.dumps({"access_token": "newtoken"}))
+            if request.headers["Authorization"] == "Bearer newtoken":
+                return httpx.Response(200, content=orjson.dumps({"credits": 5}))
+            return httpx.Response(401)
+
+        client = self._client(handler)
+        client.access_token = "oldtoken"
+        self.assertEqual(await esignbase_sdk.aget_credits(client), {"credits": 5})
+        self.assertEqual(client.access_token, "newtoken")
+
+    def _token_handler(self, token_requests: list[httpx.Request], expired_status: int = 200):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/oauth2/token":
+                token_requests.append(request)
+                await asyncio.sleep(0.01)
+                return httpx.Response(
+                    200,
+                    content=orjson.dumps(
+                        {"access_token": f"token{len(token_requests)}", "expires_in": 3600}
+                    ),
+                )
+            if request.headers["Authorization"] == "Bearer oldtoken":
+                return httpx.Response(expired_status)
+            document_id = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, content=orjson.dumps({"id": document_id}))
+
+        return handler
+
+    async def test_expired_token_is_refreshed_once_for_concurrent_requests(self):
+        token_requests: list[httpx.Request] = []
+        client = self._client(self._token_handler(token_requests))
+        client.access_token = "oldtoken"
+        client._token_expires_at = 0
+
+        ids = [f"d{i}" for i in range(20)]
+        res = await esignbase_sdk.aget_documents_bulk(client, ids)
+        self.assertEqual(res, [{"id": i} for i in ids])
+        self.assertEqual(len(token_requests), 1)
+        self.assertEqual(client.access_token, "token1")
+
+    async def test_401_reconnects_once_for_concurrent_requests(self):
+        token_requests: list[httpx.Request] = []
+        client = self._client(self._token_handler(token_requests, expired_status=401))
+        client.access_token = "oldtoken"
+
+        ids = [f"d{i}" for i in range(20)]
+        res = await esignbase_sdk.aget_documents_bulk(client, ids)
+        self.assertEqual(res, [{"id": i} for i in ids])
+        self.assertEqual(len(token_requests), 1)
+
+    async def test_adownload_document_streams_and_errors(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/document/docid/download":
+                return httpx.Response(200, content=b"part1part2")
+            return httpx.Response(500, text="err")
+
+        client = self._client(handler)
+        client.access_token = "tkn"
+        chunks = [c async for c in esignbase_sdk.adownload_document(client, "docid")]
+        self.assertEqual(b"".join(chunks), b"part1part2")
+
+        with self.assertRaises(esignbase_sdk.ESignBaseSDKError):
+            _ = [c async for c in esignbase_sdk.adownload_document(client, "other")]
+
+    async def test_aget_documents_bulk_keeps_order_and_limits_concurrency(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            document_id = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, content=orjson.dumps({"id": document_id}))
+
+        client = self._client(handler)
+        client.access_token = "tkn"
+        ids = [f"d{i}" for i in range(10)]
+        res = await esignbase_sdk.aget_documents_bulk(client, ids, batch_size=3)
+        self.assertEqual(res, [{"id": i} for i in ids])
+        self.assertLessEqual(max_in_flight, 3)
+
+    async def test_aget_documents_bulk_cancels_pending_fetches_on_error(self):
+        completed: list[str] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            document_id = request.url.path.rsplit("/", 1)[-1]
+            if document_id == "missing":
+                return httpx.Response(404, text="not found")
+            await asyncio.sleep(0.05)
+            completed.append(document_id)
+            return httpx.Response(200, content=orjson.dumps({"id": document_id}))
+
+        client = self._client(handler)
+        client.access_token = "tkn"
+        ids = ["d1", "missing", "d2", "d3"]
+        with self.assertRaises(esignbase_sdk.ESignBaseSDKError) as ctx:
+            await esignbase_sdk.aget_documents_bulk(client, ids, batch_size=2)
+        self.assertEqual(ctx.exception.status_code, 404)
+        await asyncio.sleep(0.1)
+        self.assertEqual(completed, [])
+
+    async def test_aget_documents_bulk_rejects_empty_batch(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise AssertionError(f"unexpected request to {request.url}")
+
+        client = self._client(handler)
+        client.access_token = "tkn"
+        with self.assertRaises(esignbase_sdk.ESignBaseSDKError):
+            await esignbase_sdk.aget_documents_bulk(client, ["d1"], batch_size=0)
+        with self.assertRaises(esignbase_sdk.ESignBaseSDKError):
+            await asyncio.to_thread(esignbase_sdk.get_documents_bulk, client, ["d1"], batch_size=0)